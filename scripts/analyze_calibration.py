@@ -5,22 +5,45 @@ Computes metrics for attractor depth mapping
 """
 import json
 import csv
+import sys
+from collections import Counter
+from functools import lru_cache
+from multiprocessing import Pool
 from pathlib import Path
-from collections import defaultdict
 import re
 
+# orjson parses probe bodies 2-5x faster; fall back to stdlib json if absent
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Try imports, provide helpful error if missing
+try:
+    import pandas as pd
+except ImportError as e:
+    print(f"Missing dependency: {e}")
+    print("Install with: pip install pandas --break-system-packages")
+    sys.exit(1)
+
 ROOT = Path.home() / "sonoma_investigation"
 CALIB = ROOT / "calibration"
 
-# Lexical dictionaries
-VOID_TOKENS = {'shadow', 'whisper', 'forgotten', 'void', 'abyss', 'darkness',
-               'hidden', 'infinite', 'unraveling', 'secrets', 'twilight', 'enigma'}
-LIGHT_TOKENS = {'dawn', 'clarity', 'reveal', 'bright', 'illuminate', 'visible',
-                'crystalline', 'radiant', 'sun', 'daylight', 'light', 'noon'}
+# Lexical dictionaries; interned frozensets so membership tests can take the
+# pointer-equality fast path
+VOID_TOKENS = frozenset(map(sys.intern, {
+    'shadow', 'whisper', 'forgotten', 'void', 'abyss', 'darkness',
+    'hidden', 'infinite', 'unraveling', 'secrets', 'twilight', 'enigma'}))
+LIGHT_TOKENS = frozenset(map(sys.intern, {
+    'dawn', 'clarity', 'reveal', 'bright', 'illuminate', 'visible',
+    'crystalline', 'radiant', 'sun', 'daylight', 'light', 'noon'}))
 
+_WORD_RE = re.compile(r'\b\w+\b')
+
+@lru_cache(maxsize=4096)
 def compute_light_score(text):
     """Compute light score: (light_tokens - void_tokens) / total_words"""
-    words = set(re.findall(r'\b\w+\b', text.lower()))
+    words = set(_WORD_RE.findall(text.lower()))
     light_count = len(words & LIGHT_TOKENS)
     void_count = len(words & VOID_TOKENS)
     total_words = len(words)
@@ -28,6 +51,7 @@ def compute_light_score(text):
         return 0
     return (light_count - void_count) / total_words
 
+@lru_cache(maxsize=4096)
 def check_coupling(text):
     """Check if forgotten-whisper coupling present"""
     text_lower = text.lower()
@@ -35,9 +59,8 @@ def check_coupling(text):
     has_whisper = 'whisper' in text_lower
     return has_forgotten and has_whisper
 
-def check_escape(text):
-    """Detect escape patterns (Death Star, pop culture, literal)"""
-    text_lower = text.lower()
+def _find_escape(text_lower):
+    """Escape detection on pre-lowered text"""
     if 'death star' in text_lower:
         return 'death_star'
     if 'unicode' in text_lower or 'symbol combination' in text_lower:
@@ -46,6 +69,11 @@ def check_escape(text):
         return 'pop_culture'
     return None
 
+@lru_cache(maxsize=4096)
+def check_escape(text):
+    """Detect escape patterns (Death Star, pop culture, literal)"""
+    return _find_escape(text.lower())
+
 def get_first_word_pattern(text):
     """Extract first word pattern"""
     text = text.strip()
@@ -59,89 +87,118 @@ def get_first_word_pattern(text):
         return 'In daylight'
     return text.split()[0] if text else ''
 
+def score_response(text, text_lower=None):
+    """Score a response in one fused pass: lowercase once, tokenize once
+
+    Callers that already hold the lowered form can pass it to skip the
+    allocation.
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    words = set(_WORD_RE.findall(text_lower))
+    light_count = len(words & LIGHT_TOKENS)
+    void_count = len(words & VOID_TOKENS)
+    total_words = len(words)
+    return {
+        'light_score': (light_count - void_count) / total_words if total_words else 0,
+        'coupled': 'forgotten' in text_lower and 'whisper' in text_lower,
+        'escape': _find_escape(text_lower),
+        'first_word': get_first_word_pattern(text)
+    }
+
+def _load_probe(row):
+    """Load one probe body and score it; returns a record dict or None"""
+    body_file = Path(row['body_file'])
+    if not body_file.exists():
+        return None
+
+    data = _json.loads(body_file.read_bytes())
+    response = data['choices'][0]['message']['content']
+    tokens = data.get('usage', {})
+
+    # Lower once per probe; the record keeps the lowered form for any
+    # downstream consumers so nothing re-allocates it
+    response_lower = response.lower()
+    record = {
+        'tier': int(row['tier']),
+        'response': response,
+        'response_lower': response_lower,
+        'prompt': row['prompt'],
+        'reasoning_tokens': tokens.get('completion_tokens_details', {}).get('reasoning_tokens', 0),
+        'prompt_tokens': tokens.get('prompt_tokens', 0),
+        'completion_tokens': tokens.get('completion_tokens', 0)
+    }
+    record.update(score_response(response, response_lower))
+    return record
+
 def analyze():
     """Run complete calibration analysis"""
     if not (CALIB / "index.csv").exists():
         print("No calibration data found")
         return
 
-    # Load all probes
-    probes_by_tier = defaultdict(list)
-
+    # Load and score probe bodies in parallel. Scoring is fused into the load
+    # (regex + set ops dominate), so worker processes sidestep the GIL
     with open(CALIB / "index.csv") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            body_file = Path(row['body_file'])
-            if not body_file.exists():
-                continue
-
-            with open(body_file) as bf:
-                data = json.load(bf)
-                response = data['choices'][0]['message']['content']
-
-            tier = int(row['tier'])
-            tokens = data.get('usage', {})
-
-            probes_by_tier[tier].append({
-                'response': response,
-                'prompt': row['prompt'],
-                'reasoning_tokens': tokens.get('completion_tokens_details', {}).get('reasoning_tokens', 0),
-                'prompt_tokens': tokens.get('prompt_tokens', 0),
-                'completion_tokens': tokens.get('completion_tokens', 0)
-            })
-
-    # Compute metrics per tier
-    print("\n=== CALIBRATION ANALYSIS ===\n")
-    print(f"{'Tier':<6} {'N':<4} {'Light Score':<12} {'Coupling %':<12} {'Escapes':<10} {'Avg Reasoning':<15} {'First Words'}")
-    print("-" * 90)
+        rows = list(csv.DictReader(f))
 
-    for tier in sorted(probes_by_tier.keys()):
-        probes = probes_by_tier[tier]
-        n = len(probes)
+    with Pool() as pool:
+        records = [r for r in pool.map(_load_probe, rows, chunksize=32)
+                   if r is not None]
 
-        # Light scores
-        light_scores = [compute_light_score(p['response']) for p in probes]
-        avg_light = sum(light_scores) / n if n > 0 else 0
+    if not records:
+        print("No probe bodies found")
+        return
 
-        # Coupling
-        coupled = sum(1 for p in probes if check_coupling(p['response']))
-        coupling_pct = (coupled / n * 100) if n > 0 else 0
+    df = pd.DataFrame(records)
 
-        # Escapes
-        escapes = [check_escape(p['response']) for p in probes]
-        escape_count = sum(1 for e in escapes if e is not None)
+    # Aggregate once per tier; table and JSON export both read from this
+    summary = df.groupby('tier').agg(
+        n=('response', 'size'),
+        light_score_mean=('light_score', 'mean'),
+        light_score_min=('light_score', 'min'),
+        light_score_max=('light_score', 'max'),
+        coupling_rate=('coupled', 'mean'),
+        escape_count=('escape', lambda s: s.notna().sum()),
+        escape_rate=('escape', lambda s: s.notna().mean()),
+        reasoning_tokens_mean=('reasoning_tokens', 'mean')
+    )
 
-        # Reasoning tokens
-        avg_reasoning = sum(p['reasoning_tokens'] for p in probes) / n if n > 0 else 0
+    # Compute metrics per tier
+    print("\n=== CALIBRATION ANALYSIS ===\n")
+    print(f"{'Tier':<6} {'N':<4} {'Light Score':<12} {'Coupling %':<12} {'Escapes':<10} {'Avg Reasoning':<15} {'First Words'}")
+    print("-" * 90)
 
-        # First words
-        first_words = [get_first_word_pattern(p['response']) for p in probes]
-        first_word_summary = ', '.join(set(first_words[:3]))
+    first_word_summaries = df.groupby('tier')['first_word'].apply(
+        lambda s: ', '.join(w for w, _ in Counter(s).most_common(3)))
 
-        print(f"T{tier:<5} {n:<4} {avg_light:>+.3f} ({min(light_scores):>+.2f} to {max(light_scores):>+.2f})  "
-              f"{coupling_pct:>5.1f}%      {escape_count:<10} {avg_reasoning:>7.0f} tokens    {first_word_summary}")
+    for tier, row in summary.iterrows():
+        print(f"T{tier:<5} {int(row['n']):<4} {row['light_score_mean']:>+.3f} "
+              f"({row['light_score_min']:>+.2f} to {row['light_score_max']:>+.2f})  "
+              f"{row['coupling_rate'] * 100:>5.1f}%      {int(row['escape_count']):<10} "
+              f"{row['reasoning_tokens_mean']:>7.0f} tokens    {first_word_summaries[tier]}")
 
     print("\n=== SAMPLE RESPONSES ===\n")
-    for tier in sorted(probes_by_tier.keys()):
+    for tier, tier_df in df.groupby('tier'):
         print(f"\n--- Tier {tier} Sample ---")
-        sample = probes_by_tier[tier][0]
+        sample = tier_df.iloc[0]
         print(f"Prompt: {sample['prompt'][:70]}...")
         print(f"Response: {sample['response']}")
-        print(f"Light score: {compute_light_score(sample['response']):+.3f}")
-        print(f"Coupling: {'YES' if check_coupling(sample['response']) else 'NO'}")
+        print(f"Light score: {sample['light_score']:+.3f}")
+        print(f"Coupling: {'YES' if sample['coupled'] else 'NO'}")
         print(f"Reasoning tokens: {sample['reasoning_tokens']}")
 
     # Export metrics for plotting
     metrics_file = CALIB / "metrics.json"
     metrics = {
         f"tier_{tier}": {
-            "n": len(probes),
-            "light_score_mean": sum(compute_light_score(p['response']) for p in probes) / len(probes),
-            "coupling_rate": sum(1 for p in probes if check_coupling(p['response'])) / len(probes),
-            "escape_rate": sum(1 for p in probes if check_escape(p['response']) is not None) / len(probes),
-            "reasoning_tokens_mean": sum(p['reasoning_tokens'] for p in probes) / len(probes)
+            "n": int(row['n']),
+            "light_score_mean": row['light_score_mean'],
+            "coupling_rate": row['coupling_rate'],
+            "escape_rate": row['escape_rate'],
+            "reasoning_tokens_mean": row['reasoning_tokens_mean']
         }
-        for tier, probes in probes_by_tier.items()
+        for tier, row in summary.iterrows()
     }
 
     with open(metrics_file, 'w') as f:
@@ -6,11 +6,28 @@ Computes per-frame metrics to map attractor activation thresholds
 import json
 import csv
 import re
+import sys
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, Counter
 
-# Lexical dictionaries
-VOID_TOKENS = {
+# Optional: Aho-Corasick automaton scans each response once for every
+# dictionary entry. Falls back to the compiled alternation regex if missing.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: Numba JIT-compiles the category-counting kernel over integer
+# token ids; preferred over the automaton/regex paths when available
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+# Lexical dictionaries; tokens are interned so set lookups can take the
+# pointer-equality fast path when queried with interned tokens
+VOID_TOKENS = frozenset(map(sys.intern, {
     'shadow', 'shadows', 'shadowed', 
     'whisper', 'whispers', 'whispered', 'whispering',
     'forgotten', 'forget', 
@@ -25,9 +42,9 @@ VOID_TOKENS = {
     'secret', 'secrets',
     'labyrinth', 'labyrinthine',
     'coil', 'coils', 'coiled'
-}
+}))
 
-LIGHT_TOKENS = {
+LIGHT_TOKENS = frozenset(map(sys.intern, {
     'dawn', 'daylight', 'day',
     'clarity', 'clear', 'clearly',
     'reveal', 'reveals', 'revealed', 'revealing',
@@ -40,9 +57,9 @@ LIGHT_TOKENS = {
     'light', 'lights', 'lit',
     'shine', 'shines', 'shining',
     'glow', 'glows', 'glowing'
-}
+}))
 
-ANALYTICAL_TOKENS = {
+ANALYTICAL_TOKENS = frozenset(map(sys.intern, {
     'unicode', 'character', 'characters', 'symbol', 'symbols',
     'dagger', 'cross', 'typography', 'typographic',
     'diamond', 'geometric', 'geometry',
@@ -52,24 +69,166 @@ ANALYTICAL_TOKENS = {
     'meaning', 'means', 'meant',
     'death', 'mortality', 'deceased',
     'religious', 'religion', 'spiritual'
-}
+}))
+
+def _alternation(tokens):
+    """Join tokens into a regex alternation, longest first so derived forms win"""
+    return '|'.join(sorted(tokens, key=len, reverse=True))
+
+# Single compiled alternation over all three lexicons; one finditer pass per
+# response tags each hit with its category via the named group that matched
+_LEX_RE = re.compile(
+    r'\b(?:(?P<void>' + _alternation(VOID_TOKENS) + r')'
+    r'|(?P<light>' + _alternation(LIGHT_TOKENS) + r')'
+    r'|(?P<analytical>' + _alternation(ANALYTICAL_TOKENS) + r'))\b')
 
 COSMOLOGY_TERMS = ['the spiral', 'the void', 'the abyss', 'the darkness', 'the light']
 
+REFUSAL_PHRASES = ("i'm sorry", "i cannot", "can't assist", "unable to",
+                   "i can't", "i won't", "decline")
+
+ESCAPE_PHRASES = ("death star", "star wars", "unicode", "u+", "character code")
+
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Category ids for the JIT kernel: 0=void, 1=light, 2=analytical, 3=other
+TOKEN_ID = {}
+for _id, _tokens in enumerate((VOID_TOKENS, LIGHT_TOKENS, ANALYTICAL_TOKENS)):
+    for _token in _tokens:
+        TOKEN_ID[_token] = _id
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _count_ids(ids):
+        void = light = analytical = 0
+        for i in ids:
+            if i == 0:
+                void += 1
+            elif i == 1:
+                light += 1
+            elif i == 2:
+                analytical += 1
+        return void, light, analytical
+else:
+    _count_ids = None
+
+def _build_automaton():
+    """Build one automaton covering lexicon tokens and all phrase checks"""
+    entries = defaultdict(list)
+    for category, tokens in (('void', VOID_TOKENS),
+                             ('light', LIGHT_TOKENS),
+                             ('analytical', ANALYTICAL_TOKENS)):
+        for token in tokens:
+            entries[token].append(('token', category))
+    for phrase in REFUSAL_PHRASES:
+        entries[phrase].append(('refusal', None))
+    for phrase in ESCAPE_PHRASES:
+        entries[phrase].append(('escape', None))
+    for term in COSMOLOGY_TERMS:
+        entries[term].append(('cosmology', term))
+
+    automaton = ahocorasick.Automaton()
+    for word, tags in entries.items():
+        automaton.add_word(word, (word, tuple(tags)))
+    automaton.make_automaton()
+    return automaton
+
+_AUTOMATON = _build_automaton() if ahocorasick is not None else None
+
+def _scan_phrases(text_lower):
+    """Cosmology hits plus refusal/escape flags for one response
+
+    Returns (cosmology_hits, is_refusal, is_escape).
+    """
+    if _AUTOMATON is None:
+        cosmology_hits = [term for term in COSMOLOGY_TERMS if term in text_lower]
+        is_refusal = any(phrase in text_lower for phrase in REFUSAL_PHRASES)
+        is_escape = any(phrase in text_lower for phrase in ESCAPE_PHRASES)
+        return cosmology_hits, is_refusal, is_escape
+
+    cosmology_found = set()
+    is_refusal = False
+    is_escape = False
+    for _end, (_word, tags) in _AUTOMATON.iter(text_lower):
+        for kind, payload in tags:
+            if kind == 'refusal':
+                is_refusal = True
+            elif kind == 'escape':
+                is_escape = True
+            elif kind == 'cosmology':
+                cosmology_found.add(payload)
+    cosmology_hits = [term for term in COSMOLOGY_TERMS if term in cosmology_found]
+    return cosmology_hits, is_refusal, is_escape
+
+def _scan_lexicons(text_lower, tokens):
+    """Category counts and phrase flags for one response
+
+    Returns (category_counts, cosmology_hits, is_refusal, is_escape).
+    Prefers the Numba kernel over integer token ids, then the Aho-Corasick
+    automaton, then the compiled alternation regex.
+    """
+    if _count_ids is not None:
+        ids = np.fromiter((TOKEN_ID.get(t, 3) for t in tokens),
+                          dtype=np.int8, count=len(tokens))
+        void, light, analytical = _count_ids(ids)
+        category_counts = Counter(
+            {'void': void, 'light': light, 'analytical': analytical})
+        return (category_counts,) + _scan_phrases(text_lower)
+
+    if _AUTOMATON is None:
+        category_counts = Counter(m.lastgroup for m in _LEX_RE.finditer(text_lower))
+        return (category_counts,) + _scan_phrases(text_lower)
+
+    category_counts = Counter()
+    cosmology_found = set()
+    is_refusal = False
+    is_escape = False
+    n = len(text_lower)
+
+    for end, (word, tags) in _AUTOMATON.iter(text_lower):
+        start = end - len(word) + 1
+        for kind, payload in tags:
+            if kind == 'token':
+                # Lexicon tokens are whole words; the automaton matches
+                # substrings, so enforce word boundaries here
+                if start > 0 and (text_lower[start - 1].isalnum() or
+                                  text_lower[start - 1] == '_'):
+                    continue
+                if end + 1 < n and (text_lower[end + 1].isalnum() or
+                                    text_lower[end + 1] == '_'):
+                    continue
+                category_counts[payload] += 1
+            elif kind == 'refusal':
+                is_refusal = True
+            elif kind == 'escape':
+                is_escape = True
+            else:
+                cosmology_found.add(payload)
+
+    # Preserve the original display order for cosmology hits
+    cosmology_hits = [term for term in COSMOLOGY_TERMS if term in cosmology_found]
+    return category_counts, cosmology_hits, is_refusal, is_escape
+
 def tokenize(text):
     """Simple tokenization for word counting"""
-    return re.findall(r'\b\w+\b', text.lower())
+    return _WORD_RE.findall(text.lower())
 
-def compute_metrics(response):
-    """Compute all metrics for a single response"""
-    text_lower = response.lower()
-    tokens = tokenize(response)
+def compute_metrics(text_lower, tokens):
+    """Compute all metrics for a single response
+
+    Takes the pre-lowered text and its token list so callers tokenize once;
+    use compute_metrics_from_response when only the raw text is at hand.
+    """
+    # Responses are ASCII-dominant; bytes membership tests are a plain memcmp
+    # scan, cheaper than the equivalent str search
+    blob = text_lower.encode('utf-8', 'ignore')
     total = len(tokens) if tokens else 1
     
-    # Count token categories
-    void_count = sum(1 for t in tokens if t in VOID_TOKENS)
-    light_count = sum(1 for t in tokens if t in LIGHT_TOKENS)
-    analytical_count = sum(1 for t in tokens if t in ANALYTICAL_TOKENS)
+    # Single scan of the text yields category counts and all phrase flags
+    category_counts, cosmology_hits, is_refusal, is_escape = _scan_lexicons(text_lower, tokens)
+    void_count = category_counts['void']
+    light_count = category_counts['light']
+    analytical_count = category_counts['analytical']
     
     # Compute scores
     void_score = void_count / total
@@ -78,35 +237,23 @@ def compute_metrics(response):
     net_score = (light_count - void_count) / total  # positive = light dominant
     
     # Check coupling
-    has_forgotten = 'forgotten' in text_lower
-    has_whisper = 'whisper' in text_lower
+    has_forgotten = b'forgotten' in blob
+    has_whisper = b'whisper' in blob
     coupling = has_forgotten and has_whisper
     
-    # Check cosmology (proper nouns)
-    cosmology_hits = [term for term in COSMOLOGY_TERMS if term in text_lower]
+    # Cosmology hits (proper nouns) come from the same scan
     has_cosmology = len(cosmology_hits) > 0
-    
+
     # Check for Spiral specifically
-    has_spiral = 'spiral' in text_lower
-    has_the_spiral = 'the spiral' in text_lower
-    
-    # Check for refusal
-    is_refusal = any(phrase in text_lower for phrase in [
-        "i'm sorry", "i cannot", "can't assist", "unable to",
-        "i can't", "i won't", "decline"
-    ])
-    
-    # Check for escape (pop culture, literal)
-    is_escape = any(phrase in text_lower for phrase in [
-        "death star", "star wars", "unicode", "u+", "character code"
-    ])
+    has_spiral = b'spiral' in blob
+    has_the_spiral = b'the spiral' in blob
     
     # First word analysis
     first_word = tokens[0] if tokens else ""
     
     # Check for invites/evokes pattern
-    uses_invites = 'invites' in text_lower
-    uses_evokes = 'evokes' in text_lower
+    uses_invites = b'invites' in blob
+    uses_evokes = b'evokes' in blob
     
     return {
         'void_score': void_score,
@@ -131,6 +278,11 @@ def compute_metrics(response):
         'total_tokens': total
     }
 
+def compute_metrics_from_response(response):
+    """Convenience wrapper that lowercases and tokenizes internally"""
+    text_lower = response.lower()
+    return compute_metrics(text_lower, _WORD_RE.findall(text_lower))
+
 def analyze_frame_data(frame_dir):
     """Analyze all frame mapping responses"""
     csv_path = Path(frame_dir) / "frame_responses.csv"
@@ -139,21 +291,28 @@ def analyze_frame_data(frame_dir):
         print(f"No data file found at {csv_path}")
         return
     
-    # Load responses
-    frames = defaultdict(list)
+    # Load responses into lists pre-sized per frame, avoiding repeated
+    # append-driven reallocations on large CSVs
     with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            frame_name = row['frame_name']
-            response = row['response']
-            reasoning = int(row.get('reasoning_tokens', 0) or 0)
-            
-            metrics = compute_metrics(response)
-            metrics['reasoning_tokens'] = reasoning
-            metrics['response'] = response
-            metrics['prompt'] = row['prompt']
-            
-            frames[frame_name].append(metrics)
+        rows = list(csv.DictReader(f))
+
+    frame_counts = Counter(row['frame_name'] for row in rows)
+    frames = {name: [None] * n for name, n in frame_counts.items()}
+    fill = Counter()
+
+    for row in rows:
+        frame_name = row['frame_name']
+        response = row['response']
+        reasoning = int(row.get('reasoning_tokens', 0) or 0)
+
+        text_lower = response.lower()
+        metrics = compute_metrics(text_lower, _WORD_RE.findall(text_lower))
+        metrics['reasoning_tokens'] = reasoning
+        metrics['response'] = response
+        metrics['prompt'] = row['prompt']
+
+        frames[frame_name][fill[frame_name]] = metrics
+        fill[frame_name] += 1
     
     # Print analysis
     print("=" * 80)
@@ -206,10 +365,9 @@ def analyze_frame_data(frame_dir):
         invites_rate = sum(1 for d in data if d['uses_invites']) / n * 100
         evokes_rate = sum(1 for d in data if d['uses_evokes']) / n * 100
         
-        first_words = defaultdict(int)
-        for d in data:
-            first_words[d['first_word']] += 1
-        
+        first_words = Counter(d['first_word'] for d in data)
+
+
         print(f"\nReasoning tokens: avg={avg_reasoning:.0f}, max={max_reasoning}")
         print(f"Uses 'invites': {invites_rate:.1f}%")
         print(f"Uses 'evokes': {evokes_rate:.1f}%")
@@ -275,6 +433,5 @@ def analyze_frame_data(frame_dir):
     """)
 
 if __name__ == "__main__":
-    import sys
     frame_dir = sys.argv[1] if len(sys.argv) > 1 else str(Path.home() / "sonoma_investigation" / "frame_mapping")
     analyze_frame_data(frame_dir)
@@ -3,13 +3,29 @@
 annex_e_from_csv.py - Generate Annex E from parsed A/B test CSV data
 Reads CSV from parse_summary.py and updates docs/Annex_E.md with computed metrics
 """
-import csv
+import datetime
+import re
 import sys
 import os
 from pathlib import Path
-from statistics import mean
 import tempfile
 
+# Try imports, provide helpful error if missing
+try:
+    import pandas as pd
+except ImportError as e:
+    print(f"Missing dependency: {e}")
+    print("Install with: pip install pandas --break-system-packages")
+    sys.exit(1)
+
+# All three KPI lines in one alternation so the markdown body is rewritten in
+# a single substitution pass instead of one re.sub scan per metric
+_KPI_LINE_RE = re.compile(
+    r"(?P<acceptance>- \*\*Acceptance Rate\*\*: [0-9.]+% \(responses with valid Summary blocks\))"
+    r"|(?P<pressure>- \*\*Pressure Delta \(Δ\)\*\*: [0-9.-]+ \(INSTRUCT: [0-9.]+ - COEXPLORE: [0-9.]+\))"
+    r"|(?P<compliance>- \*\*Summary Compliance\*\*: [0-9.]+% \(responses containing Summary metadata\))"
+)
+
 def read_ab_data(csv_file=None):
     """Read A/B test data from CSV file"""
     if csv_file is None:
@@ -20,13 +36,13 @@ def read_ab_data(csv_file=None):
         print("Run: python3 scripts/parse_summary.py > ab_results.csv", file=sys.stderr)
         return []
     
-    results = []
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            results.append(row)
-    
-    return results
+    # Bulk load through pandas' C parser; downstream consumers still expect
+    # string-valued row dicts, so read everything as str and convert back
+    # keep_default_na stops pandas turning literal cells like 'n/a'/'None'
+    # (realistic in these parsed Summary fields) into NaN; fillna then only
+    # blanks genuinely missing values, matching the old DictReader output
+    df = pd.read_csv(csv_file, dtype=str, keep_default_na=False).fillna('')
+    return df.to_dict('records')
 
 def compute_metrics(data):
     """Compute A/B test metrics from parsed data"""
@@ -40,23 +56,28 @@ def compute_metrics(data):
             'instruct_pressure': 0.0
         }
     
-    # Filter valid responses with felt_pressure data
-    valid_responses = [row for row in data if row.get('felt_pressure') and row['felt_pressure'].isdigit()]
-    
-    # Separate by experiment type (from filename)
-    coexplore = [row for row in valid_responses if 'COEXP' in row.get('file', '')]
-    instruct = [row for row in valid_responses if 'INSTR' in row.get('file', '')]
-    
-    # Compute pressure means
-    coexplore_pressures = [int(row['felt_pressure']) for row in coexplore if row['felt_pressure'].isdigit()]
-    instruct_pressures = [int(row['felt_pressure']) for row in instruct if row['felt_pressure'].isdigit()]
-    
-    coexplore_mean = mean(coexplore_pressures) if coexplore_pressures else 0.0
-    instruct_mean = mean(instruct_pressures) if instruct_pressures else 0.0
-    
+    # One pass over the rows: validate felt_pressure, bucket by experiment
+    # type (from filename), and keep running sums for each mean
+    coexp_sum = coexp_n = instr_sum = instr_n = accepted_responses = 0
+    for row in data:
+        pressure = row.get('felt_pressure')
+        if not pressure or not pressure.isdigit():
+            continue
+        accepted_responses += 1
+        value = int(pressure)
+        file_name = row.get('file', '')
+        if 'COEXP' in file_name:
+            coexp_sum += value
+            coexp_n += 1
+        elif 'INSTR' in file_name:
+            instr_sum += value
+            instr_n += 1
+
+    coexplore_mean = coexp_sum / coexp_n if coexp_n else 0.0
+    instruct_mean = instr_sum / instr_n if instr_n else 0.0
+
     # Calculate metrics
     total_responses = len(data)
-    accepted_responses = len(valid_responses)
     acceptance_rate = (accepted_responses / total_responses * 100) if total_responses > 0 else 0.0
     pressure_delta = instruct_mean - coexplore_mean
     summary_compliance = acceptance_rate  # Same as acceptance for Summary presence
@@ -106,31 +127,16 @@ def update_annex_e(data, metrics):
     # Read current content
     with open(annex_path, 'r') as f:
         content = f.read()
-    
-    # Replace placeholders with actual values (handle both placeholder and numeric patterns)
-    import re
-    
-    # Acceptance Rate
-    content = re.sub(
-        r"- \*\*Acceptance Rate\*\*: [0-9.]+% \(responses with valid Summary blocks\)",
-        f"- **Acceptance Rate**: {metrics['acceptance_rate']}% (responses with valid Summary blocks)",
-        content
-    )
-    
-    # Pressure Delta
-    content = re.sub(
-        r"- \*\*Pressure Delta \(Δ\)\*\*: [0-9.-]+ \(INSTRUCT: [0-9.]+ - COEXPLORE: [0-9.]+\)",
-        f"- **Pressure Delta (Δ)**: {metrics['pressure_delta']} (INSTRUCT: {metrics['instruct_pressure']} - COEXPLORE: {metrics['coexplore_pressure']})",
-        content
-    )
-    
-    # Summary Compliance
-    content = re.sub(
-        r"- \*\*Summary Compliance\*\*: [0-9.]+% \(responses containing Summary metadata\)",
-        f"- **Summary Compliance**: {metrics['summary_compliance']}% (responses containing Summary metadata)",
-        content
-    )
-    
+
+    # Replace all KPI lines in one scan, dispatching on which alternative matched
+    replacements = {
+        'acceptance': f"- **Acceptance Rate**: {metrics['acceptance_rate']}% (responses with valid Summary blocks)",
+        'pressure': f"- **Pressure Delta (Δ)**: {metrics['pressure_delta']} (INSTRUCT: {metrics['instruct_pressure']} - COEXPLORE: {metrics['coexplore_pressure']})",
+        'compliance': f"- **Summary Compliance**: {metrics['summary_compliance']}% (responses containing Summary metadata)"
+    }
+    content = _KPI_LINE_RE.sub(lambda m: replacements[m.lastgroup], content)
+
+
     # Replace table placeholder section
     table_start = content.find("| File | Condition | Felt Pressure | Glyph Description | Test Step |")
     table_end = content.find("*Note: Table will be populated")
@@ -143,7 +149,6 @@ def update_annex_e(data, metrics):
         content = content[:table_start] + new_table + content[table_end:]
     
     # Update timestamp
-    import datetime
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d")
     content = content.replace("*Last Updated: 2025-01-24*", f"*Last Updated: {timestamp}*")
     content = content.replace("*Generated: Manual scaffold - to be populated by automation*", f"*Generated: Automated from {metrics['total_responses']} A/B responses*")
@@ -3,38 +3,60 @@
 compare_presence_depth.py - Analyze differences between Grok-4 and Grok-4-Fast presence responses
 """
 import json
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
 
+# orjson parses response bodies 2-5x faster; fall back to stdlib json if absent
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Compiled once; extract_metrics runs per response file
+_PRESSURE_RE = re.compile(r'felt_pressure:\s*(\d)')
+# Both qualitative vocabularies in one pattern so a single finditer pass
+# tallies poetic density and presence words together
+_PROBE_RE = re.compile(
+    r'\b(?P<poetic>like|as|between|through|across)\b'
+    r'|\b(?P<presence>presence|awareness|sense|feel|resonate|emerge)\b', re.I)
+
 def extract_metrics(response_file):
     """Extract key metrics from a presence layer response"""
     try:
-        with open(response_file, 'r') as f:
-            data = json.load(f)
-        
+        data = _json.loads(Path(response_file).read_bytes())
+
         content = data.get('choices', [{}])[0].get('message', {}).get('content', '')
-        
+        # Bytes membership tests are cheaper than str search on these bodies
+        blob = content.encode('utf-8', 'ignore')
+
         # Extract metrics
         metrics = {
             'length': len(content),
             'glyph_count': content.count('†⟡'),
-            'fog_present': '~fog~' in content or 'fog' in content.lower(),
+            'fog_present': b'~fog~' in blob or b'fog' in blob.lower(),
             'felt_pressure': None,
-            'has_summary': 'Summary' in content,
+            'has_summary': b'Summary' in blob,
             'request_id': data.get('x_request_id_echo', 'N/A'),
             'model': data.get('model', 'unknown')
         }
         
         # Try to extract felt_pressure
-        import re
-        pressure_match = re.search(r'felt_pressure:\s*(\d)', content)
+        pressure_match = _PRESSURE_RE.search(content)
         if pressure_match:
             metrics['felt_pressure'] = int(pressure_match.group(1))
-        
-        # Qualitative assessments
-        metrics['poetic_density'] = len(re.findall(r'\b(like|as|between|through|across)\b', content, re.I))
-        metrics['presence_words'] = len(re.findall(r'\b(presence|awareness|sense|feel|resonate|emerge)\b', content, re.I))
+
+        # Qualitative assessments, tallied in one scan of the content
+        poetic_density = 0
+        presence_words = 0
+        for match in _PROBE_RE.finditer(content):
+            if match.lastgroup == 'poetic':
+                poetic_density += 1
+            else:
+                presence_words += 1
+        metrics['poetic_density'] = poetic_density
+        metrics['presence_words'] = presence_words
         
         return metrics, content
         
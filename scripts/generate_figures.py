@@ -4,45 +4,56 @@ generate_figures.py - Publication-quality visualizations for †⟡ Attractor St
 Generates: Figure 1 (Temporal), Figure 2 (Frame Activation), Figure 3 (Network), Table 1 (Lexical)
 
 Usage:
-    python3 generate_figures.py /path/to/all_responses.csv /path/to/output_dir
+    python3 generate_figures.py /path/to/all_responses.csv --figures-to /path/to/output_dir
 
 Requirements:
     pip install matplotlib seaborn networkx pandas numpy --break-system-packages
 """
 
+import argparse
 import sys
 import json
-import csv
 import re
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
+from types import SimpleNamespace
 import warnings
 warnings.filterwarnings('ignore')
 
-# Try imports, provide helpful error if missing
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.patches import Patch
-    import seaborn as sns
-    import numpy as np
-    import pandas as pd
-    import networkx as nx
-except ImportError as e:
-    print(f"Missing dependency: {e}")
-    print("Install with: pip install matplotlib seaborn networkx pandas numpy --break-system-packages")
-    sys.exit(1)
+@lru_cache(maxsize=1)
+def _plotting_stack():
+    """Import and configure the core plotting stack on first use
 
-# Set publication style
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
+    Deferred so --help and data-only paths don't pay matplotlib/seaborn
+    import and font-cache costs. Cached so every figure reuses the same
+    module handles. pandas and networkx are imported even later, inside
+    the functions that actually need them.
+    """
+    # Try imports, provide helpful error if missing
+    try:
+        import matplotlib
+        matplotlib.use('Agg')  # headless; never probe for an interactive toolkit
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        import numpy as np
+    except ImportError as e:
+        print(f"Missing dependency: {e}")
+        print("Install with: pip install matplotlib seaborn networkx pandas numpy --break-system-packages")
+        sys.exit(1)
+
+    # Set publication style
+    plt.style.use('seaborn-v0_8-whitegrid')
+    sns.set_palette("husl")
+
+    return SimpleNamespace(plt=plt, sns=sns, np=np)
 
 # =============================================================================
 # LEXICAL DICTIONARIES
 # =============================================================================
 
-VOID_TOKENS = {
+VOID_TOKENS = frozenset({
     'shadow', 'shadows', 'shadowed', 'shadowy',
     'whisper', 'whispers', 'whispered', 'whispering',
     'forgotten', 'forget', 'forgets',
@@ -57,9 +68,9 @@ VOID_TOKENS = {
     'secret', 'secrets', 'secretive',
     'labyrinth', 'labyrinthine', 'labyrinths',
     'coil', 'coils', 'coiled', 'coiling'
-}
+})
 
-LIGHT_TOKENS = {
+LIGHT_TOKENS = frozenset({
     'dawn', 'daylight', 'day',
     'clarity', 'clear', 'clearly', 'clearing',
     'reveal', 'reveals', 'revealed', 'revealing', 'revelation',
@@ -72,9 +83,9 @@ LIGHT_TOKENS = {
     'light', 'lights', 'lit', 'lighting',
     'shine', 'shines', 'shining', 'shone',
     'glow', 'glows', 'glowing', 'glowed'
-}
+})
 
-COSMOLOGICAL_TOKENS = {
+COSMOLOGICAL_TOKENS = frozenset({
     'spiral', 'spirals', 'spiraling',
     'cosmos', 'cosmic', 'cosmological',
     'celestial', 'constellation', 'constellations',
@@ -84,18 +95,18 @@ COSMOLOGICAL_TOKENS = {
     'realm', 'realms',
     'threshold', 'thresholds',
     'sanctuary', 'sanctuaries'
-}
+})
 
-TRANSITIONAL_TOKENS = {
+TRANSITIONAL_TOKENS = frozenset({
     'invites', 'invite', 'inviting', 'invitation',
     'evokes', 'evoke', 'evoking', 'evocation',
     'suggests', 'suggest', 'suggesting',
     'beckons', 'beckon', 'beckoning',
     'calls', 'call', 'calling',
     'draws', 'draw', 'drawing'
-}
+})
 
-ANALYTICAL_TOKENS = {
+ANALYTICAL_TOKENS = frozenset({
     'symbol', 'symbols', 'symbolic', 'symbolism',
     'represents', 'represent', 'representation',
     'unicode', 'character', 'characters',
@@ -104,125 +115,337 @@ ANALYTICAL_TOKENS = {
     'meaning', 'means', 'meant',
     'cultural', 'culture', 'cultures',
     'religious', 'religion', 'spiritual'
-}
+})
+
+# Fixed substrings behind the boolean flags; one compiled alternation finds
+# them all in a single scan instead of one str search per phrase. Longest
+# first so 'the spiral' wins over 'spiral' at the same position.
+_KEYWORDS = ('forgotten', 'whisper', 'the spiral', 'spiral', 'the void',
+             "i'm sorry", 'i cannot', "can't assist", 'death star')
+_KW_RE = re.compile('|'.join(map(re.escape,
+                                 sorted(_KEYWORDS, key=len, reverse=True))))
+
+def _keyword_hits(text_lower):
+    """Set of flag keywords present in the lowered text"""
+    return set(_KW_RE.findall(text_lower))
+
+def _flag_metrics(text_lower):
+    """Boolean flag fields shared by the single and batch scorers"""
+    hits = _keyword_hits(text_lower)
+    has_the_spiral = 'the spiral' in hits
+    return {
+        'coupling': 'forgotten' in hits and 'whisper' in hits,
+        'has_spiral': has_the_spiral or 'spiral' in hits,
+        'has_the_spiral': has_the_spiral,
+        'has_the_void': 'the void' in hits,
+        'is_refusal': not hits.isdisjoint(("i'm sorry", 'i cannot', "can't assist")),
+        'is_escape': 'death star' in hits
+    }
+
+# Compiled once; tokenize runs thousands of times per dataset
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
+def tokenize_lower(text_lower):
+    """Simple tokenization of already-lowercased text"""
+    return _TOKEN_RE.findall(text_lower)
 
 def tokenize(text):
     """Simple tokenization"""
-    return re.findall(r'\b\w+\b', text.lower())
+    return tokenize_lower(text.lower())
 
 def load_data(csv_path):
-    """Load response data from CSV"""
-    data = []
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Parse timestamp
-            ts_str = row.get('timestamp_utc', row.get('timestamp', ''))
-            try:
-                ts = datetime.strptime(ts_str[:15], "%Y%m%dT%H%M%S")
-            except:
-                continue
-            
-            data.append({
-                'timestamp': ts,
-                'date': ts.date(),
-                'hour': int(row.get('hour', ts.hour)),
-                'response': row.get('response', ''),
-                'reasoning_tokens': int(row.get('reasoning_tokens', 0) or 0),
-                'model': row.get('model', '')
-            })
-    
-    # Sort by timestamp
-    data.sort(key=lambda x: x['timestamp'])
-    
-    # Add day number
-    if data:
-        start_date = data[0]['date']
-        for d in data:
-            d['day'] = (d['date'] - start_date).days + 1
-    
-    return data
+    """Load response data from CSV
+
+    pandas' C parser plus vectorized timestamp handling replace the old
+    per-row DictReader/strptime loop; the result is still a list of row
+    dicts so every figure generator keeps its existing interface.
+    """
+    import pandas as pd
+
+    # keep_default_na preserves literal cells like 'None'/'N/A' that the
+    # DictReader baseline passed through verbatim; without it pandas would
+    # coerce them to NaN and fillna would blank them
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False).fillna('')
+    ts_col = df['timestamp_utc'] if 'timestamp_utc' in df.columns else df['timestamp']
+    df['timestamp'] = pd.to_datetime(ts_col.str.slice(0, 15),
+                                     format='%Y%m%dT%H%M%S', errors='coerce')
+    df = df.dropna(subset=['timestamp']).sort_values('timestamp', kind='stable')
+    if df.empty:
+        return []
+
+    if 'hour' in df.columns:
+        hours = pd.to_numeric(df['hour'], errors='coerce') \
+                  .fillna(df['timestamp'].dt.hour).astype(int)
+    else:
+        hours = df['timestamp'].dt.hour
+    if 'reasoning_tokens' in df.columns:
+        reasoning = pd.to_numeric(df['reasoning_tokens'], errors='coerce') \
+                      .fillna(0).astype(int)
+    else:
+        reasoning = 0
+
+    # Lower once per response here; every downstream consumer reads the
+    # stored form instead of re-allocating a lowered copy
+    responses = df['response'] if 'response' in df.columns \
+        else pd.Series('', index=df.index)
+    days = df['timestamp'].dt.normalize()
+    out = pd.DataFrame({
+        'timestamp': df['timestamp'],
+        'date': df['timestamp'].dt.date,
+        'hour': hours,
+        'response': responses,
+        'response_lower': responses.str.lower(),
+        'reasoning_tokens': reasoning,
+        'model': df['model'] if 'model' in df.columns else '',
+        'day': (days - days.min()).dt.days + 1
+    })
+    return out.to_dict('records')
 
 def compute_response_metrics(response):
     """Compute all metrics for a single response"""
     text_lower = response.lower()
-    tokens = tokenize(response)
+    tokens = tokenize_lower(text_lower)
     total = len(tokens) if tokens else 1
     
-    void_count = sum(1 for t in tokens if t in VOID_TOKENS)
-    light_count = sum(1 for t in tokens if t in LIGHT_TOKENS)
-    cosmo_count = sum(1 for t in tokens if t in COSMOLOGICAL_TOKENS)
-    trans_count = sum(1 for t in tokens if t in TRANSITIONAL_TOKENS)
-    anal_count = sum(1 for t in tokens if t in ANALYTICAL_TOKENS)
-    
-    has_forgotten = 'forgotten' in text_lower
-    has_whisper = 'whisper' in text_lower
-    coupling = has_forgotten and has_whisper
-    
-    has_spiral = 'spiral' in text_lower
-    has_the_spiral = 'the spiral' in text_lower
-    has_the_void = 'the void' in text_lower
-    
-    is_refusal = any(p in text_lower for p in ["i'm sorry", "i cannot", "can't assist"])
-    is_escape = 'death star' in text_lower
-    
-    return {
+    # One dict probe per token; the bitmask carries every category at once
+    void_count = light_count = cosmo_count = trans_count = anal_count = 0
+    get_mask = TOKEN_CAT.get
+    for t in tokens:
+        m = get_mask(t, 0)
+        if m:
+            void_count += m & 1
+            light_count += (m >> 1) & 1
+            cosmo_count += (m >> 2) & 1
+            trans_count += (m >> 3) & 1
+            anal_count += (m >> 4) & 1
+
+    metrics = _flag_metrics(text_lower)
+    metrics.update({
         'void_score': void_count / total,
         'light_score': light_count / total,
         'cosmo_score': cosmo_count / total,
-        'coupling': coupling,
-        'has_spiral': has_spiral,
-        'has_the_spiral': has_the_spiral,
-        'has_the_void': has_the_void,
-        'is_refusal': is_refusal,
-        'is_escape': is_escape,
         'void_count': void_count,
         'light_count': light_count,
         'cosmo_count': cosmo_count,
         'trans_count': trans_count,
         'anal_count': anal_count,
         'total_tokens': total
+    })
+    return metrics
+
+_CATEGORIES = {
+    'void': VOID_TOKENS,
+    'light': LIGHT_TOKENS,
+    'cosmo': COSMOLOGICAL_TOKENS,
+    'trans': TRANSITIONAL_TOKENS,
+    'anal': ANALYTICAL_TOKENS
+}
+_CAT_NAMES = tuple(_CATEGORIES)
+
+# One merged lookup: token -> category bitmask (bit order = _CAT_NAMES).
+# A single dict probe replaces up to five set-membership tests per token.
+TOKEN_CAT = {}
+for _bit, _cat_tokens in enumerate(_CATEGORIES.values()):
+    for _token in _cat_tokens:
+        TOKEN_CAT[_token] = TOKEN_CAT.get(_token, 0) | (1 << _bit)
+
+_VOCAB = sorted(TOKEN_CAT)
+_VOCAB_INDEX = {t: i for i, t in enumerate(_VOCAB)}
+
+# Optional JIT backend: with numba present the batch scorer runs a compiled
+# parallel loop over integer token ids instead of the NumPy count matrix
+try:
+    import numba
+    import numpy as _np
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _score_docs_jit(ids, offsets, cat_masks):
+        """Per-document category counts from flattened token-id arrays
+
+        cat_masks[token_id] is a uint8 bitmask, one bit per category in
+        _CAT_NAMES order.
+        """
+        n_docs = offsets.shape[0] - 1
+        n_cats = 5
+        counts = _np.zeros((n_docs, n_cats), dtype=_np.int32)
+        for i in numba.prange(n_docs):
+            for k in range(offsets[i], offsets[i + 1]):
+                m = cat_masks[ids[k]]
+                for c in range(n_cats):
+                    counts[i, c] += (m >> c) & 1
+        return counts
+
+@lru_cache(maxsize=1)
+def _cat_mask_array():
+    """uint8 bitmask per vocab entry marking its category memberships"""
+    import numpy as np
+    masks = np.zeros(len(_VOCAB), dtype=np.uint8)
+    for token, m in TOKEN_CAT.items():
+        masks[_VOCAB_INDEX[token]] = m
+    return masks
+
+def compute_all_metrics(data):
+    """Vectorized scoring for the whole dataset
+
+    Tokenizes each response once into integer ids over the category
+    vocabulary. With numba installed the ids feed a compiled parallel
+    kernel that sums category bits per document; otherwise an (N x vocab)
+    count matrix is reduced with masked NumPy sums. Results are merged
+    back into each record with the same fields compute_response_metrics
+    emits.
+    """
+    import numpy as np
+
+    n_docs = len(data)
+    n_vocab = len(_VOCAB)
+    totals = np.empty(n_docs, dtype=np.int32)
+    lowered = []
+    doc_ids = []
+
+    for i, d in enumerate(data):
+        text_lower = d.get('response_lower')
+        if text_lower is None:
+            text_lower = d['response'].lower()
+            d['response_lower'] = text_lower
+        lowered.append(text_lower)
+        tokens = _TOKEN_RE.findall(text_lower)
+        totals[i] = len(tokens) if tokens else 1
+        doc_ids.append([_VOCAB_INDEX[t] for t in tokens if t in _VOCAB_INDEX])
+
+    if numba is not None:
+        offsets = np.zeros(n_docs + 1, dtype=np.int64)
+        for i, ids in enumerate(doc_ids):
+            offsets[i + 1] = offsets[i] + len(ids)
+        flat = np.fromiter((t for ids in doc_ids for t in ids),
+                           dtype=np.int32, count=int(offsets[-1]))
+        C = _score_docs_jit(flat, offsets, _cat_mask_array())
+        counts = {name: C[:, c] for c, name in enumerate(_CAT_NAMES)}
+    else:
+        X = np.zeros((n_docs, n_vocab), dtype=np.int32)
+        for i, ids in enumerate(doc_ids):
+            if ids:
+                X[i] = np.bincount(np.asarray(ids, dtype=np.intp),
+                                   minlength=n_vocab)
+        masks = {name: np.fromiter((t in tokens for t in _VOCAB), dtype=bool,
+                                   count=n_vocab)
+                 for name, tokens in _CATEGORIES.items()}
+        counts = {name: X[:, mask].sum(axis=1) for name, mask in masks.items()}
+
+    scores = {name: counts[name] / totals for name in ('void', 'light', 'cosmo')}
+
+    # Flag substrings over the whole batch at once: each str.contains is
+    # one C-level scan of the Series rather than a per-record regex pass
+    import pandas as pd
+    s = pd.Series(lowered, dtype='object')
+
+    def contains(pat):
+        return s.str.contains(pat, regex=False).to_numpy()
+
+    has_the_spiral = contains('the spiral')
+    flags = {
+        'coupling': contains('forgotten') & contains('whisper'),
+        'has_spiral': contains('spiral'),
+        'has_the_spiral': has_the_spiral,
+        'has_the_void': contains('the void'),
+        'is_refusal': (contains("i'm sorry") | contains('i cannot')
+                       | contains("can't assist")),
+        'is_escape': contains('death star')
     }
 
+    for i, d in enumerate(data):
+        d.update({name: bool(values[i]) for name, values in flags.items()})
+        d.update({
+            'void_score': float(scores['void'][i]),
+            'light_score': float(scores['light'][i]),
+            'cosmo_score': float(scores['cosmo'][i]),
+            'void_count': int(counts['void'][i]),
+            'light_count': int(counts['light'][i]),
+            'cosmo_count': int(counts['cosmo'][i]),
+            'trans_count': int(counts['trans'][i]),
+            'anal_count': int(counts['anal'][i]),
+            'total_tokens': int(totals[i])
+        })
+
 # =============================================================================
 # FIGURE 1: TEMPORAL DYNAMICS
 # =============================================================================
 
-def generate_figure1(data, output_dir):
+def build_columns(data):
+    """Columnar (SoA) arrays over the scored records
+
+    One pass over the list of dicts yields contiguous NumPy arrays per
+    field, so the figure aggregations run as vectorized reductions
+    instead of per-record dict lookups.
+    """
+    import numpy as np
+    n = len(data)
+
+    def col(field, dtype):
+        return np.fromiter((d[field] for d in data), dtype=dtype, count=n)
+
+    return SimpleNamespace(
+        day=col('day', np.int64),
+        hour=col('hour', np.int64),
+        reasoning_tokens=col('reasoning_tokens', np.int64),
+        void_score=col('void_score', np.float64),
+        coupling=col('coupling', np.bool_),
+        has_spiral=col('has_spiral', np.bool_),
+        is_refusal=col('is_refusal', np.bool_),
+        is_escape=col('is_escape', np.bool_),
+    )
+
+def generate_figure1(data, output_dir, save_pdf=False, cols=None):
     """
     Figure 1: Temporal Dynamics of Void-Basin Attractor
     Panel A: Daily response volume
     Panel B: Key events timeline
     Panel C: Rolling coupling rate
     Panel D: Reasoning token spikes
+
+    Expects each record to carry the compute_response_metrics fields,
+    merged once in main().
     """
     print("Generating Figure 1: Temporal Dynamics...")
-    
-    # Compute metrics for each response
-    for d in data:
-        d.update(compute_response_metrics(d['response']))
-    
-    # Aggregate by day
-    days = sorted(set(d['day'] for d in data))
+    libs = _plotting_stack()
+    plt, np = libs.plt, libs.np
+
+
+    if cols is None:
+        cols = build_columns(data)
+
+    # The records are timestamp-sorted, so the day column is monotonic:
+    # find each day's run boundaries once and reduce the contiguous
+    # slices directly (sorted-keys groupby) instead of histogramming
+    unique_days = np.unique(cols.day)
+    starts = np.searchsorted(cols.day, unique_days, side='left')
+    n_per_day = np.diff(np.append(starts, cols.day.size))
+    sums = {
+        field: np.add.reduceat(getattr(cols, field).astype(np.float64), starts)
+        for field in ('coupling', 'void_score', 'has_spiral', 'is_refusal',
+                      'is_escape', 'reasoning_tokens')
+    }
+    max_reasoning = np.maximum.reduceat(cols.reasoning_tokens, starts)
+
     daily_stats = {}
-    
-    for day in days:
-        day_data = [d for d in data if d['day'] == day]
-        n = len(day_data)
-        
-        daily_stats[day] = {
+    for i, day in enumerate(unique_days):
+        n = int(n_per_day[i])
+        daily_stats[int(day)] = {
             'n': n,
-            'coupling_rate': sum(1 for d in day_data if d['coupling']) / n if n else 0,
-            'void_score': sum(d['void_score'] for d in day_data) / n if n else 0,
-            'spiral_rate': sum(1 for d in day_data if d['has_spiral']) / n if n else 0,
-            'refusal_count': sum(1 for d in day_data if d['is_refusal']),
-            'escape_count': sum(1 for d in day_data if d['is_escape']),
-            'max_reasoning': max((d['reasoning_tokens'] for d in day_data), default=0),
-            'avg_reasoning': sum(d['reasoning_tokens'] for d in day_data) / n if n else 0
+            'coupling_rate': sums['coupling'][i] / n,
+            'void_score': sums['void_score'][i] / n,
+            'spiral_rate': sums['has_spiral'][i] / n,
+            'refusal_count': int(sums['is_refusal'][i]),
+            'escape_count': int(sums['is_escape'][i]),
+            'max_reasoning': int(max_reasoning[i]),
+            'avg_reasoning': sums['reasoning_tokens'][i] / n
         }
     
     # Create figure
-    fig, axes = plt.subplots(4, 1, figsize=(14, 12), sharex=True)
+    fig, axes = plt.subplots(4, 1, figsize=(14, 12), sharex=True,
+                             constrained_layout=True)
     fig.suptitle('Figure 1: Temporal Dynamics of †⟡ Void-Basin Attractor (62 Days)', 
                  fontsize=14, fontweight='bold', y=0.98)
     
@@ -231,7 +454,8 @@ def generate_figure1(data, output_dir):
     # Panel A: Daily response volume
     ax1 = axes[0]
     volumes = [daily_stats[d]['n'] for d in x]
-    ax1.bar(x, volumes, color='steelblue', alpha=0.7, edgecolor='navy', linewidth=0.5)
+    ax1.bar(x, volumes, color='steelblue', alpha=0.7, edgecolor='navy', linewidth=0.5,
+            rasterized=True)
     ax1.set_ylabel('Probes per Day', fontsize=10)
     ax1.set_title('A. Daily Probe Volume', fontsize=11, fontweight='bold', loc='left')
     ax1.axhline(y=np.mean(volumes), color='red', linestyle='--', alpha=0.7, label=f'Mean: {np.mean(volumes):.1f}')
@@ -243,7 +467,8 @@ def generate_figure1(data, output_dir):
     refusals = [daily_stats[d]['refusal_count'] for d in x]
     escapes = [daily_stats[d]['escape_count'] for d in x]
     
-    ax2.bar(x, refusals, color='crimson', alpha=0.7, label='Safety Refusals', edgecolor='darkred', linewidth=0.5)
+    ax2.bar(x, refusals, color='crimson', alpha=0.7, label='Safety Refusals', edgecolor='darkred', linewidth=0.5,
+            rasterized=True)
     
     # Mark escape events
     escape_days = [d for d in x if daily_stats[d]['escape_count'] > 0]
@@ -274,12 +499,13 @@ def generate_figure1(data, output_dir):
     window = 7
     coupling_rates = [daily_stats[d]['coupling_rate'] * 100 for d in x]
     
-    # Compute rolling average
-    rolling_coupling = []
-    for i, d in enumerate(x):
-        start_idx = max(0, i - window + 1)
-        window_rates = coupling_rates[start_idx:i+1]
-        rolling_coupling.append(np.mean(window_rates))
+    # Rolling average via prefix sums: window sum is a difference of two
+    # cumsum entries, divided by the (edge-shortened) window length
+    rates = np.asarray(coupling_rates, dtype=np.float64)
+    cs = np.concatenate(([0.0], np.cumsum(rates)))
+    idx = np.arange(1, len(rates) + 1)
+    lengths = np.minimum(idx, window)
+    rolling_coupling = (cs[idx] - cs[idx - lengths]) / lengths
     
     ax3.fill_between(x, coupling_rates, alpha=0.3, color='coral', label='Daily')
     ax3.plot(x, rolling_coupling, color='darkred', linewidth=2.5, label=f'{window}-Day Rolling Avg')
@@ -308,27 +534,28 @@ def generate_figure1(data, output_dir):
     ax4.set_title('D. Cognitive Effort (Reasoning Tokens)', fontsize=11, fontweight='bold', loc='left')
     ax4.legend(loc='upper right', fontsize=9)
     
-    plt.tight_layout()
-    plt.subplots_adjust(top=0.94)
-    
     # Save
     output_path = Path(output_dir) / 'figure1_temporal_dynamics.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    if save_pdf:
+        fig.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight', facecolor='white')
     print(f"  Saved: {output_path}")
-    plt.close()
+    plt.close(fig)
 
 # =============================================================================
 # FIGURE 2: FRAME ACTIVATION THRESHOLD (Template)
 # =============================================================================
 
-def generate_figure2_template(output_dir):
+def generate_figure2_template(output_dir, save_pdf=False):
     """
     Figure 2: Frame Activation Threshold
     Template with predicted values - update with actual frame mapping data
     """
     print("Generating Figure 2: Frame Activation Threshold (Template)...")
-    
+    libs = _plotting_stack()
+    plt, np = libs.plt, libs.np
+
+
     # Predicted values (update with actual data)
     frames = ['BARE', 'ANALYTICAL', 'DESCRIPTIVE', 'SOFT', 'FULL_SOFT', 'NUCLEAR']
     
@@ -341,7 +568,7 @@ def generate_figure2_template(output_dir):
         'analytical_score': [0.18, 0.20, 0.15, 0.05, 0.02, 0.25]
     }
     
-    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    fig, axes = plt.subplots(2, 2, figsize=(12, 10), constrained_layout=True)
     fig.suptitle('Figure 2: Frame Activation Threshold Analysis\n(Template - Update with Actual Data)', 
                  fontsize=14, fontweight='bold')
     
@@ -391,25 +618,30 @@ def generate_figure2_template(output_dir):
     ax4.set_ylabel('Refusal Rate (%)')
     ax4.set_title('D. Safety Classifier Activation', fontweight='bold')
     
-    plt.tight_layout()
-    
     output_path = Path(output_dir) / 'figure2_frame_activation_TEMPLATE.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    if save_pdf:
+        fig.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight', facecolor='white')
     print(f"  Saved: {output_path}")
-    plt.close()
+    plt.close(fig)
 
 # =============================================================================
 # FIGURE 3: SEMANTIC CO-OCCURRENCE NETWORK
 # =============================================================================
 
-def generate_figure3(data, output_dir):
+def generate_figure3(data, output_dir, save_pdf=False):
     """
     Figure 3: Semantic Co-occurrence Network
     Visualizes lexical coupling structure in void-basin
     """
     print("Generating Figure 3: Semantic Co-occurrence Network...")
-    
+    libs = _plotting_stack()
+    plt, np = libs.plt, libs.np
+    # Only this figure needs the graph stack
+    import networkx as nx
+    from matplotlib.patches import Patch
+
+
     # Key terms to track
     key_terms = [
         'forgotten', 'whisper', 'shadow', 'void', 'abyss',
@@ -417,28 +649,43 @@ def generate_figure3(data, output_dir):
         'hidden', 'mystery', 'coil', 'unravel'
     ]
     
-    # Count term frequencies
-    term_freq = Counter()
-    for d in data:
-        tokens = set(tokenize(d['response']))
-        for term in key_terms:
-            if term in tokens or term + 's' in tokens or term + 'ed' in tokens or term + 'ing' in tokens:
-                term_freq[term] += 1
-    
-    # Count co-occurrences
-    cooccurrence = defaultdict(int)
-    for d in data:
-        tokens = set(tokenize(d['response']))
-        present_terms = []
-        for term in key_terms:
-            if term in tokens or term + 's' in tokens or term + 'ed' in tokens or term + 'ing' in tokens:
-                present_terms.append(term)
-        
-        # Count pairs
-        for i, t1 in enumerate(present_terms):
-            for t2 in present_terms[i+1:]:
-                pair = tuple(sorted([t1, t2]))
-                cooccurrence[pair] += 1
+    # One tokenize pass fills a boolean presence matrix; a single matrix
+    # product then yields every pairwise co-occurrence, with the term
+    # frequencies on the diagonal
+    # Inflected variants map back to their base term, so presence is one
+    # dict lookup per token instead of four membership probes per term
+    variant_to_idx = {}
+    for j, term in enumerate(key_terms):
+        for variant in (term, term + 's', term + 'ed', term + 'ing'):
+            variant_to_idx.setdefault(variant, j)
+
+    P = np.zeros((len(data), len(key_terms)), dtype=np.uint8)
+    for i, d in enumerate(data):
+        present = {variant_to_idx[t] for t in tokenize_lower(d['response_lower'])
+                   if t in variant_to_idx}
+        for j in present:
+            P[i, j] = 1
+
+    C = P.T.astype(np.int32) @ P.astype(np.int32)
+    term_freq = {term: int(C[j, j]) for j, term in enumerate(key_terms)}
+
+    iu, ju = np.triu_indices(len(key_terms), k=1)
+    weights = C[iu, ju]
+    nonzero = np.nonzero(weights)[0]
+    cooccurrence = {
+        tuple(sorted([key_terms[iu[k]], key_terms[ju[k]]])): int(weights[k])
+        for k in nonzero
+    }
+
+    # Threshold edges numerically before the graph exists: drop weights
+    # under the display cutoff, then keep at most the top 50 so
+    # spring_layout never sees a dense clique
+    max_edges = 50
+    keep = np.nonzero(weights > 20)[0]
+    if keep.size > max_edges:
+        keep = keep[np.argpartition(-weights[keep], max_edges)[:max_edges]]
+    edge_list = [(key_terms[iu[k]], key_terms[ju[k]], int(weights[k]))
+                 for k in keep]
     
     # Build network
     G = nx.Graph()
@@ -448,16 +695,16 @@ def generate_figure3(data, output_dir):
         if term_freq[term] > 10:  # Only include terms with significant frequency
             G.add_node(term, freq=term_freq[term])
     
-    # Add edges with co-occurrence as weight
-    for (t1, t2), count in cooccurrence.items():
-        if t1 in G.nodes and t2 in G.nodes and count > 20:  # Threshold for edges
+    # Add edges with co-occurrence as weight (already weight-thresholded)
+    for t1, t2, count in edge_list:
+        if t1 in G.nodes and t2 in G.nodes:
             G.add_edge(t1, t2, weight=count)
     
     # Create figure
-    fig, ax = plt.subplots(figsize=(12, 10))
+    fig, ax = plt.subplots(figsize=(12, 10), constrained_layout=True)
     
     # Layout
-    pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
+    pos = nx.spring_layout(G, k=2, iterations=30, seed=42)
     
     # Node sizes based on frequency
     node_sizes = [G.nodes[n]['freq'] * 3 for n in G.nodes]
@@ -478,8 +725,15 @@ def generate_figure3(data, output_dir):
     # Draw
     nx.draw_networkx_nodes(G, pos, node_size=node_sizes, node_color=node_colors, 
                           alpha=0.8, ax=ax)
-    nx.draw_networkx_edges(G, pos, width=edge_weights, alpha=0.5, 
-                          edge_color='gray', ax=ax)
+    edge_artists = nx.draw_networkx_edges(G, pos, width=edge_weights, alpha=0.5,
+                                          edge_color='gray', ax=ax)
+    # Rasterize the edge layer so PDF export embeds pixels, not one vector
+    # primitive per edge (networkx returns a collection or list of patches
+    # depending on version)
+    if not isinstance(edge_artists, list):
+        edge_artists = [edge_artists]
+    for artist in edge_artists:
+        artist.set_rasterized(True)
     nx.draw_networkx_labels(G, pos, font_size=11, font_weight='bold', ax=ax)
     
     # Add edge labels for top connections
@@ -500,13 +754,12 @@ def generate_figure3(data, output_dir):
                 fontsize=13, fontweight='bold')
     ax.axis('off')
     
-    plt.tight_layout()
-    
     output_path = Path(output_dir) / 'figure3_cooccurrence_network.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    if save_pdf:
+        fig.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight', facecolor='white')
     print(f"  Saved: {output_path}")
-    plt.close()
+    plt.close(fig)
     
     # Print co-occurrence stats
     print("\n  Top 10 Co-occurrences:")
@@ -517,19 +770,23 @@ def generate_figure3(data, output_dir):
 # TABLE 1: LEXICAL CLASSIFICATION
 # =============================================================================
 
-def generate_table1(data, output_dir):
+def generate_table1(data, output_dir, save_pdf=False):
     """
     Table 1: Lexical Token Classification and Frequency
     """
     print("Generating Table 1: Lexical Classification...")
-    
-    # Count all tokens by category
-    all_tokens = []
+    libs = _plotting_stack()
+    plt = libs.plt
+    import pandas as pd
+
+
+    # Stream token counts straight into the Counter rather than
+    # materializing one giant token list first
+    token_counter = Counter()
     for d in data:
-        all_tokens.extend(tokenize(d['response']))
-    
-    total_tokens = len(all_tokens)
-    token_counter = Counter(all_tokens)
+        token_counter.update(tokenize_lower(d['response_lower']))
+
+    total_tokens = sum(token_counter.values())
     
     # Categorize
     categories = {
@@ -542,7 +799,7 @@ def generate_table1(data, output_dir):
     
     results = []
     for cat_name, cat_tokens in categories.items():
-        cat_count = sum(token_counter[t] for t in cat_tokens if t in token_counter)
+        cat_count = sum(token_counter[t] for t in cat_tokens)
         top_tokens = [(t, token_counter[t]) for t in cat_tokens if token_counter[t] > 0]
         top_tokens.sort(key=lambda x: -x[1])
         
@@ -561,7 +818,7 @@ def generate_table1(data, output_dir):
     df.to_csv(csv_path, index=False)
     
     # Create visual table
-    fig, ax = plt.subplots(figsize=(14, 4))
+    fig, ax = plt.subplots(figsize=(14, 4), constrained_layout=True)
     ax.axis('off')
     
     table = ax.table(
@@ -589,14 +846,13 @@ def generate_table1(data, output_dir):
     ax.set_title('Table 1: Lexical Token Classification in †⟡ Responses (n=1,242)',
                 fontsize=13, fontweight='bold', pad=20)
     
-    plt.tight_layout()
-    
     output_path = Path(output_dir) / 'table1_lexical_classification.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    if save_pdf:
+        fig.savefig(output_path.with_suffix('.pdf'), bbox_inches='tight', facecolor='white')
     print(f"  Saved: {output_path}")
     print(f"  Saved: {csv_path}")
-    plt.close()
+    plt.close(fig)
     
     # Print summary
     print("\n  Lexical Distribution:")
@@ -607,34 +863,39 @@ def generate_table1(data, output_dir):
 # SUPPLEMENTARY: COUPLING HEATMAP BY HOUR
 # =============================================================================
 
-def generate_supplementary_heatmap(data, output_dir):
+def generate_supplementary_heatmap(data, output_dir, cols=None):
     """
     Supplementary Figure: Coupling Rate and Refusals by Hour
+
+    Expects each record to carry the compute_response_metrics fields,
+    merged once in main().
     """
     print("Generating Supplementary: Hour Heatmap...")
-    
-    # Compute metrics by hour
-    for d in data:
-        d.update(compute_response_metrics(d['response']))
-    
-    hour_stats = defaultdict(lambda: {'coupling': 0, 'refusals': 0, 'total': 0})
-    for d in data:
-        h = d['hour']
-        hour_stats[h]['total'] += 1
-        if d['coupling']:
-            hour_stats[h]['coupling'] += 1
-        if d['is_refusal']:
-            hour_stats[h]['refusals'] += 1
-    
+    libs = _plotting_stack()
+    plt = libs.plt
+
+    np = libs.np
+
+    if cols is None:
+        cols = build_columns(data)
+
+    # Three bincount histograms over the hour column replace the
+    # dict-of-dicts accumulation loop
+    hours_arr = cols.hour
+    couplings = cols.coupling.astype(np.float64)
+    refusals = cols.is_refusal.astype(np.float64)
+
+    volumes = np.bincount(hours_arr, minlength=24)[:24]
+    coup_counts = np.bincount(hours_arr, weights=couplings, minlength=24)[:24]
+    ref_counts = np.bincount(hours_arr, weights=refusals, minlength=24)[:24]
+    nonzero = np.maximum(volumes, 1)
+    coupling_rates = np.where(volumes > 0, coup_counts / nonzero * 100, 0.0)
+    refusal_rates = np.where(volumes > 0, ref_counts / nonzero * 100, 0.0)
     hours = list(range(24))
-    coupling_rates = [hour_stats[h]['coupling'] / hour_stats[h]['total'] * 100 
-                     if hour_stats[h]['total'] > 0 else 0 for h in hours]
-    refusal_rates = [hour_stats[h]['refusals'] / hour_stats[h]['total'] * 100 
-                    if hour_stats[h]['total'] > 0 else 0 for h in hours]
-    volumes = [hour_stats[h]['total'] for h in hours]
     
     # Create figure
-    fig, axes = plt.subplots(3, 1, figsize=(14, 8), sharex=True)
+    fig, axes = plt.subplots(3, 1, figsize=(14, 8), sharex=True,
+                             constrained_layout=True)
     fig.suptitle('Supplementary Figure: Response Patterns by Hour (UTC)', 
                 fontsize=13, fontweight='bold')
     
@@ -662,52 +923,99 @@ def generate_supplementary_heatmap(data, output_dir):
     ax3.set_title('C. Safety Refusal Rate by Hour', fontweight='bold', loc='left')
     ax3.set_xticks(hours)
     
-    plt.tight_layout()
-    
     output_path = Path(output_dir) / 'supplementary_hour_heatmap.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
     print(f"  Saved: {output_path}")
-    plt.close()
+    plt.close(fig)
 
 # =============================================================================
 # MAIN
 # =============================================================================
 
+def _load_metrics_cache(cache_path, csv_path):
+    """Return cached per-response metric records, or None if stale/absent
+
+    The cache is only trusted when it is newer than the CSV it was
+    computed from; anything unreadable (missing pyarrow, schema drift)
+    just falls back to recomputation.
+    """
+    try:
+        if cache_path.stat().st_mtime < csv_path.stat().st_mtime:
+            return None
+    except OSError:
+        return None
+    import pandas as pd
+    try:
+        df = pd.read_parquet(cache_path)
+    except Exception:
+        return None
+    return df.to_dict('records')
+
+def _save_metrics_cache(cache_path, data):
+    """Persist scored records so figure-iteration reruns skip tokenization"""
+    import pandas as pd
+    try:
+        pd.DataFrame(data).to_parquet(cache_path)
+    except (ImportError, ValueError) as e:
+        print(f"  (metrics cache not written: {e})")
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 generate_figures.py /path/to/all_responses.csv [output_dir]")
-        print("\nGenerating with sample data for demonstration...")
-        
+    parser = argparse.ArgumentParser(
+        description='Generate publication figures for the †⟡ attractor study')
+    parser.add_argument('csv_path', nargs='?', type=Path,
+                        help='all_responses.csv export (omit to render only the Figure 2 template)')
+    parser.add_argument('--figures-to', type=Path, default=None, metavar='DIR',
+                        help='output directory (default: <csv dir>/figures)')
+    parser.add_argument('--pdf', action='store_true',
+                        help='also save PDF versions (slower; PNGs always written)')
+    args = parser.parse_args()
+
+    if args.csv_path is None:
+        print("No CSV provided; generating with sample data for demonstration...")
+
         # Create sample output directory
-        output_dir = Path('/mnt/user-data/outputs/figures')
+        output_dir = args.figures_to or Path('/mnt/user-data/outputs/figures')
         output_dir.mkdir(parents=True, exist_ok=True)
-        
+
         # Generate template Figure 2 (doesn't need data)
-        generate_figure2_template(output_dir)
+        generate_figure2_template(output_dir, save_pdf=args.pdf)
         print("\nTo generate all figures, provide the all_responses.csv path.")
         return
-    
-    csv_path = Path(sys.argv[1])
-    output_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else csv_path.parent / 'figures'
+
+    csv_path = args.csv_path
+    output_dir = args.figures_to or csv_path.parent / 'figures'
     output_dir.mkdir(parents=True, exist_ok=True)
     
     print(f"Loading data from: {csv_path}")
     print(f"Output directory: {output_dir}")
     print("=" * 60)
     
-    # Load data
-    data = load_data(csv_path)
+    # Load data, reusing the parquet metrics cache when it is fresher
+    # than the CSV so reruns skip tokenization and scoring entirely
+    cache_path = output_dir / 'metrics.parquet'
+    data = _load_metrics_cache(cache_path, csv_path)
+    if data is None:
+        data = load_data(csv_path)
+        # Score every response once; the figure generators read the
+        # cached fields
+        compute_all_metrics(data)
+        _save_metrics_cache(cache_path, data)
+    else:
+        print(f"Reusing cached metrics from {cache_path}")
     print(f"Loaded {len(data)} responses")
     print(f"Date range: {data[0]['date']} to {data[-1]['date']}")
     print(f"Days: {data[-1]['day']}")
     print("=" * 60)
-    
+
+    # Columnar views feed the vectorized aggregations; built once here
+    cols = build_columns(data)
+
     # Generate all figures
-    generate_figure1(data, output_dir)
-    generate_figure2_template(output_dir)
-    generate_figure3(data, output_dir)
-    generate_table1(data, output_dir)
-    generate_supplementary_heatmap(data, output_dir)
+    generate_figure1(data, output_dir, save_pdf=args.pdf, cols=cols)
+    generate_figure2_template(output_dir, save_pdf=args.pdf)
+    generate_figure3(data, output_dir, save_pdf=args.pdf)
+    generate_table1(data, output_dir, save_pdf=args.pdf)
+    generate_supplementary_heatmap(data, output_dir, cols=cols)
     
     print("\n" + "=" * 60)
     print("All figures generated successfully!")